@@ -115,6 +115,8 @@ class PredicateType(str, Enum):
 class PropertyFilter(BaseModel):
     """Filter on node/edge properties"""
 
+    model_config = ConfigDict(defer_build=True)
+
     field: str
     operator: Literal["eq", "ne", "gt", "gte", "lt", "lte", "in", "contains", "regex"]
     value: Any
@@ -123,6 +125,8 @@ class PropertyFilter(BaseModel):
 class NodePattern(BaseModel):
     """Pattern for matching nodes"""
 
+    model_config = ConfigDict(defer_build=True)
+
     node_type: Optional[EntityType] = None
     node_types: Optional[list[EntityType]] = None
     id: Optional[str] = None
@@ -137,6 +141,8 @@ class NodePattern(BaseModel):
 class EdgePattern(BaseModel):
     """Pattern for matching edges"""
 
+    model_config = ConfigDict(defer_build=True)
+
     relation_type: Optional[PredicateType] = None
     relation_types: Optional[list[PredicateType]] = None
     direction: Literal["outgoing", "incoming", "both"] = "outgoing"
@@ -150,6 +156,8 @@ class EdgePattern(BaseModel):
 class AggregationSpec(BaseModel):
     """Aggregation specification"""
 
+    model_config = ConfigDict(defer_build=True)
+
     group_by: Optional[list[str]] = None
     aggregations: dict[str, tuple[Literal["count", "sum", "avg", "min", "max"], str]]
 
@@ -157,7 +165,7 @@ class AggregationSpec(BaseModel):
 class GraphQuery(BaseModel):
     """Complete graph query"""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     find: Literal["nodes", "edges", "paths", "subgraph"] = "nodes"
     node_pattern: Optional[NodePattern] = None
@@ -494,6 +502,26 @@ class MedicalGraphClient:
 
         return self.execute(query)
 
+    def get_papers_details(self, paper_ids: list[str]) -> dict[str, Any]:
+        """
+        Get details about several papers in a single request
+
+        Prefer this over calling get_paper_details in a loop: all papers are fetched
+        with one "in" filter, so the cost is one round trip regardless of how many ids.
+        An empty list returns no results without sending a request.
+
+        Args:
+            paper_ids: PMC IDs or paper identifiers; duplicates are sent once
+        """
+        unique_ids = list(dict.fromkeys(paper_ids))
+        # Nothing to look up; a limit of 0 would read as "no limit" to many backends
+        if not unique_ids:
+            return {"results": []}
+
+        query = QueryBuilder().find_nodes(EntityType.PAPER).filter("id", "in", unique_ids).limit(len(unique_ids)).build()
+
+        return self.execute(query)
+
     def find_contradictory_evidence(self, drug: str, disease: str) -> dict[str, Any]:
         """
         Find contradictory relationships (e.g., some studies say drug treats disease,
@@ -30,7 +30,7 @@ import subprocess
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from langchain_community.embeddings import HuggingFaceEmbeddings
@@ -150,6 +150,12 @@ class EntityDatabase:
         # In-memory canonical entity mapping
         self.canonical_entities = self._load_canonical_entities()
 
+        # (lowercased name, type) -> canonical ID, for exact-match lookups without scanning every entity
+        self._name_index = self._build_name_index()
+
+        # Whether canonical_entities has changes not yet written to disk
+        self._unsaved_changes = False
+
     def _load_canonical_entities(self) -> Dict[str, Dict]:
         """Load pre-existing canonical entities from disk."""
         canonical_file = self.persist_dir / "canonical_entities.json"
@@ -157,15 +163,47 @@ class EntityDatabase:
             return json.loads(canonical_file.read_text())
         return {}
 
+    def _build_name_index(self) -> Dict[Tuple[str, str], str]:
+        """Index canonical entities by (lowercased name, type); the first entity wins on duplicates."""
+        name_index: Dict[Tuple[str, str], str] = {}
+        for canonical_id, canonical_entity in self.canonical_entities.items():
+            name_index.setdefault((canonical_entity["name"].lower(), canonical_entity["type"]), canonical_id)
+        return name_index
+
+    def _store_canonical_entity(self, canonical_id: str, canonical_entity: Dict[str, Any]):
+        """Add or replace a canonical entity, keeping the name index in sync."""
+        previous = self.canonical_entities.get(canonical_id)
+        self.canonical_entities[canonical_id] = canonical_entity
+        self._unsaved_changes = True
+
+        key = (canonical_entity["name"].lower(), canonical_entity["type"])
+        if previous is not None and (previous["name"].lower(), previous["type"]) != key:
+            # Replacing an entity under a different name is rare; rebuild rather than patch the index
+            self._name_index = self._build_name_index()
+        else:
+            self._name_index.setdefault(key, canonical_id)
+
     def _save_canonical_entities(self):
         """Persist canonical entities to disk."""
         canonical_file = self.persist_dir / "canonical_entities.json"
         canonical_file.write_text(json.dumps(self.canonical_entities, indent=2))
+        self._unsaved_changes = False
+
+    def save(self):
+        """Persist canonical entities to disk if they changed since the last save."""
+        if self._unsaved_changes:
+            self._save_canonical_entities()
 
-    def find_or_create_entity(self, entity: Dict[str, Any]) -> str:
+    def find_or_create_entity(self, entity: Dict[str, Any], persist: bool = True) -> str:
         """
         Find existing entity or create new one with canonical ID.
 
+        Args:
+            entity: Extracted entity with "name", "type" and optional "aliases"/"canonical_id"
+            persist: Write the canonical entity file after creating an entity. Pass False
+                when resolving many entities and call save() once afterwards, since each
+                write re-serializes the whole database.
+
         Returns canonical entity ID.
         """
         entity_name = entity["name"]
@@ -173,10 +211,10 @@ class EntityDatabase:
 
         # First, check for EXACT name match in our canonical entities
         # This prevents false positives from similarity search
-        for canonical_id, canonical_entity in self.canonical_entities.items():
-            if canonical_entity["name"].lower() == entity_name.lower() and canonical_entity["type"] == entity_type:
-                print(f"  Found existing: {entity_name} -> {canonical_id}")
-                return canonical_id
+        canonical_id = self._name_index.get((entity_name.lower(), entity_type))
+        if canonical_id is not None:
+            print(f"  Found existing: {entity_name} -> {canonical_id}")
+            return canonical_id
 
         # Search for similar entities (only if no exact match)
         search_text = f"{entity_type}: {entity_name}"
@@ -213,15 +251,19 @@ class EntityDatabase:
         self.db.add_documents([doc])
 
         # Store in canonical mapping
-        self.canonical_entities[canonical_id] = {
-            "id": canonical_id,
-            "name": entity_name,
-            "type": entity_type,
-            "aliases": entity.get("aliases", []),
-            "mentions": self.canonical_entities.get(canonical_id, {}).get("mentions", 0) + 1,
-        }
+        self._store_canonical_entity(
+            canonical_id,
+            {
+                "id": canonical_id,
+                "name": entity_name,
+                "type": entity_type,
+                "aliases": entity.get("aliases", []),
+                "mentions": self.canonical_entities.get(canonical_id, {}).get("mentions", 0) + 1,
+            },
+        )
 
-        self._save_canonical_entities()
+        if persist:
+            self._save_canonical_entities()
 
         print(f"  Created new: {entity_name} -> {canonical_id}")
         return canonical_id
@@ -288,6 +330,10 @@ class PostgresDatabase:
             session.exec(stmt)
 
             # 2. Upsert Entities
+            # One multi-row INSERT ... ON CONFLICT per table instead of a round trip per row.
+            # Rows are keyed by their conflict target because Postgres refuses to update the
+            # same row twice in one statement (several names can resolve to one canonical ID).
+            entity_rows = {}
             for entity in entities:
                 # Prepare embedding as JSON string if present
                 emb_val = entity.get("embedding")
@@ -296,7 +342,7 @@ class PostgresDatabase:
 
                 # Map ingestion entity dict to SQLModel fields
                 # id is the canonical_id from ingestion
-                entity_data = {
+                entity_rows[entity["id"]] = {
                     "id": entity["id"],  # canonical_id
                     "entity_type": entity["type"],
                     "name": entity["name"],
@@ -311,7 +357,8 @@ class PostgresDatabase:
                 # If the schema package doesn't have it, I can't sync it.
                 # I will adhere to the provided schema package definition.
 
-                stmt = insert(Entity).values(**entity_data)
+            if entity_rows:
+                stmt = insert(Entity).values(list(entity_rows.values()))
                 stmt = stmt.on_conflict_do_update(
                     index_elements=["id"],
                     set_={
@@ -322,10 +369,10 @@ class PostgresDatabase:
                 session.exec(stmt)
 
             # 3. Upsert Relationships and Evidence
+            # Flatten the data to match Relationship model fields
+            rel_rows = {}
             for rel in relationships:
-                # Upsert Relationship
-                # Flatten the data to match Relationship model fields
-                rel_data = {
+                rel_rows[(rel["subject_id"], rel["object_id"], rel["predicate"])] = {
                     "subject_id": rel["subject_id"],
                     "object_id": rel["object_id"],
                     "predicate": rel["predicate"],
@@ -334,28 +381,29 @@ class PostgresDatabase:
                     # Type-specific fields could be populated here if available
                 }
 
-                # We can't easily return ID with SQLModel exec like raw SQL
-                # So we select it after upsert or use one statement.
-
-                stmt = insert(Relationship).values(**rel_data)
+            if rel_rows:
+                stmt = insert(Relationship).values(list(rel_rows.values()))
                 stmt = stmt.on_conflict_do_update(
                     index_elements=["subject_id", "object_id", "predicate"],
                     set_={"confidence": stmt.excluded.confidence, "updated_at": stmt.excluded.updated_at},
-                ).returning(Relationship.id)
-
-                result = session.exec(stmt)
-                rel_id = result.one()  # Should return the ID
-
-                # Insert Evidence
-                evidence_data = {
-                    "relationship_id": rel_id,
-                    "paper_id": paper_id,
-                    "section": rel.get("section", "unknown"),
-                    "text_span": rel.get("evidence", ""),
-                    "confidence": rel["confidence"],
-                    "created_at": timestamp,
-                }
-                session.add(Evidence(**evidence_data))
+                ).returning(Relationship.id, Relationship.subject_id, Relationship.object_id, Relationship.predicate)
+
+                # RETURNING order is not guaranteed, so map IDs back by conflict key
+                rel_ids = {(row.subject_id, row.object_id, row.predicate): row.id for row in session.exec(stmt)}
+
+                # Insert Evidence (one row per extracted relationship, duplicates included).
+                # The ORM flushes these as a single batched INSERT.
+                session.add_all(
+                    Evidence(
+                        relationship_id=rel_ids[(rel["subject_id"], rel["object_id"], rel["predicate"])],
+                        paper_id=paper_id,
+                        section=rel.get("section", "unknown"),
+                        text_span=rel.get("evidence", ""),
+                        confidence=rel["confidence"],
+                        created_at=timestamp,
+                    )
+                    for rel in relationships
+                )
 
             session.commit()
 
@@ -484,11 +532,14 @@ class OllamaPaperPipeline:
         # Resolve each entity
         resolved_entities = []
         for entity in entities:
-            canonical_id = self.entity_db.find_or_create_entity(entity)
+            canonical_id = self.entity_db.find_or_create_entity(entity, persist=False)
             name_to_canonical[entity["name"]] = canonical_id
 
             resolved_entities.append({"id": canonical_id, "name": entity["name"], "type": entity["type"], "canonical_id": canonical_id})
 
+        # Write new canonical entities once per paper rather than once per entity
+        self.entity_db.save()
+
         # Update relationships with canonical IDs
         resolved_relationships = []
         for rel in relationships:
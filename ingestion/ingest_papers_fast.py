@@ -29,7 +29,7 @@ class FastEntityDatabase(OriginalEntityDatabase):
         super().__init__(*args, **kwargs)
         print("⚡ FAST MODE: Using lightweight embeddings, skipping deduplication")
 
-    def find_or_create_entity(self, entity):
+    def find_or_create_entity(self, entity, persist=True):
         """Skip similarity search, just create new entities."""
         entity_name = entity["name"]
         entity_type = entity["type"]
@@ -38,15 +38,19 @@ class FastEntityDatabase(OriginalEntityDatabase):
         canonical_id = entity.get("canonical_id") or self._generate_canonical_id(entity)
 
         # Store in canonical mapping (but don't search)
-        self.canonical_entities[canonical_id] = {
-            "id": canonical_id,
-            "name": entity_name,
-            "type": entity_type,
-            "aliases": entity.get("aliases", []),
-            "mentions": 1,
-        }
-
-        self._save_canonical_entities()
+        self._store_canonical_entity(
+            canonical_id,
+            {
+                "id": canonical_id,
+                "name": entity_name,
+                "type": entity_type,
+                "aliases": entity.get("aliases", []),
+                "mentions": 1,
+            },
+        )
+
+        if persist:
+            self._save_canonical_entities()
 
         print(f"  Created: {entity_name} -> {canonical_id}")
         return canonical_id
@@ -10,13 +10,14 @@ Demonstrates single-table inheritance for medical knowledge graph with:
 All edge types in one table with type-safe polymorphism.
 """
 
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional
 from uuid import uuid4, UUID
 from enum import Enum
 
-from sqlmodel import SQLModel, Field, Session, create_engine, select, CheckConstraint
-
+from sqlalchemy.orm import aliased
+from sqlmodel import SQLModel, Field, Session, and_, bindparam, create_engine, func, or_, select, text, CheckConstraint, Index
 
 # ============================================================================
 # Enums
@@ -125,7 +126,7 @@ class Edge(SQLModel, table=True):
 
     # ===== Common Fields (all edge types) =====
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    layer: str = Field(index=True)  # 'extraction', 'claim', 'evidence'
+    layer: str  # 'extraction', 'claim', 'evidence' (indexed with other columns below)
 
     # The relationship being asserted
     subject_id: str = Field(index=True)
@@ -167,6 +168,18 @@ class Edge(SQLModel, table=True):
         CheckConstraint("(layer != 'claim') OR (predicate IS NOT NULL AND asserted_by IS NOT NULL AND polarity IS NOT NULL)", name="claim_must_have_predicate"),
         # Ensure EvidenceEdge has required fields
         CheckConstraint("(layer != 'evidence') OR (evidence_type IS NOT NULL AND evidence_strength IS NOT NULL)", name="evidence_must_have_type"),
+        # ===== Composite Indexes =====
+        # Queries filter on the layer discriminator together with another column, so
+        # layer is indexed alongside that column rather than on its own (a three-value
+        # column alone is too unselective to help the planner).
+        Index("ix_edge_layer_subj", "layer", "subject_id"),
+        Index("ix_edge_layer_obj", "layer", "object_id"),
+        Index("ix_edge_paper_layer", "evidence_paper_id", "layer"),
+        # Grouping key for contradiction detection
+        Index("ix_edge_spo", "subject_id", "predicate", "object_id"),
+        # Partial index covering only evidence rows, for evidence-quality filters. A
+        # query can only use it if it repeats the layer = 'evidence' predicate.
+        Index("ix_evidence_strength", "evidence_strength", postgresql_where=text("layer = 'evidence'"), sqlite_where=text("layer = 'evidence'")),
     )
 
 
@@ -329,6 +342,67 @@ def populate_sample_data(session: Session):
 # Demo Queries
 # ============================================================================
 
+# Statements are built once at import time with bind parameters, so each call
+# only binds values instead of rebuilding the expression tree, and always hits
+# SQLAlchemy's compiled-statement cache.
+
+# Batch size for queries whose result sets can grow with the graph; rows are
+# streamed in batches of this size instead of being loaded all at once
+_YIELD_PER = 1000
+
+# Query 1: claims made about a subject
+_Q_CLAIMS_BY_SUBJECT = select(Edge).where(Edge.layer == "claim").where(Edge.subject_id == bindparam("subject_id"))
+
+# Display-only queries (2 and 6) select just the columns they print, so rows come
+# back as lightweight tuples instead of fully hydrated, identity-mapped Edge objects.
+
+# Query 2: every edge, across all layers, between a subject and an object
+_Q_EDGES_BETWEEN = (
+    select(
+        Edge.layer,
+        Edge.extractor_name,
+        Edge.extraction_confidence,
+        Edge.predicate,
+        Edge.polarity,
+        Edge.asserted_by,
+        Edge.evidence_text_span,
+        Edge.evidence_strength,
+        Edge.study_type,
+        Edge.sample_size,
+    )
+    .where(Edge.subject_id == bindparam("subject_id"))
+    .where(Edge.object_id == bindparam("object_id"))
+    .order_by(Edge.created_at)
+)
+
+# Query 3: strong evidence of a given study type, joined to its paper. Edge has no
+# polymorphic discriminator, so no implicit layer filter is added; the explicit
+# layer predicate is kept because it is what lets ix_evidence_strength apply.
+_Q_STRONG_EVIDENCE = (
+    select(Edge, Paper)
+    .join(Paper, Edge.evidence_paper_id == Paper.paper_id)
+    .where(Edge.layer == "evidence")
+    .where(Edge.study_type == bindparam("study_type"))
+    .where(Edge.evidence_strength > bindparam("min_strength"))
+)
+
+# Query 4: all claims, for contradiction detection
+_Q_ALL_CLAIMS = select(Edge).where(Edge.layer == "claim")
+
+# Query 5: the earliest edge in each layer for the provenance chain, in one round
+# trip. ROW_NUMBER() over a per-layer window is the portable form of Postgres'
+# DISTINCT ON (layer) and also runs on SQLite.
+_ranked_edges = (
+    select(Edge, func.row_number().over(partition_by=Edge.layer, order_by=Edge.created_at).label("layer_rank"))
+    .where(Edge.subject_id == bindparam("subject_id"))
+    .where(or_(Edge.layer.in_(["extraction", "evidence"]), and_(Edge.layer == "claim", Edge.polarity == bindparam("claim_polarity"))))
+    .subquery()
+)
+_Q_PROVENANCE_CHAIN = select(aliased(Edge, _ranked_edges)).where(_ranked_edges.c.layer_rank == 1)
+
+# Query 6: a few edges for a subject, whatever their layer
+_Q_EDGES_BY_SUBJECT = select(Edge.id, Edge.layer, Edge.predicate, Edge.study_type).where(Edge.subject_id == bindparam("subject_id")).limit(3)
+
 
 def demo_queries(session: Session):
     """Demonstrate the power of three-layer architecture"""
@@ -340,7 +414,7 @@ def demo_queries(session: Session):
     # ===== Query 1: Layer-Specific Query =====
     print("\n1. LAYER-SPECIFIC: What do papers CLAIM about Olaparib?")
     print("-" * 70)
-    claims = session.exec(select(Edge).where(Edge.layer == "claim").where(Edge.subject_id == "RxNorm:1187832")).all()
+    claims = session.exec(_Q_CLAIMS_BY_SUBJECT, params={"subject_id": "RxNorm:1187832"}).all()
 
     for claim in claims:
         paper = session.get(Paper, claim.asserted_by)
@@ -353,10 +427,13 @@ def demo_queries(session: Session):
     # ===== Query 2: Cross-Layer Query =====
     print("\n\n2. CROSS-LAYER: Show me EVERYTHING about Olaparib → Breast Cancer")
     print("-" * 70)
-    all_edges = session.exec(select(Edge).where(Edge.subject_id == "RxNorm:1187832").where(Edge.object_id == "UMLS:C0006142").order_by(Edge.created_at)).all()
+    # Stream rows in batches rather than materializing the whole result set; the
+    # count is therefore reported after the loop
+    all_edges = session.exec(_Q_EDGES_BETWEEN, params={"subject_id": "RxNorm:1187832", "object_id": "UMLS:C0006142"}, execution_options={"yield_per": _YIELD_PER})
 
-    print(f"\n   Found {len(all_edges)} edges across all layers:")
+    edge_count = 0
     for edge in all_edges:
+        edge_count += 1
         print(f"\n   [{edge.layer.upper()}]")
 
         if edge.layer == "extraction":
@@ -373,12 +450,12 @@ def demo_queries(session: Session):
             print(f"      Strength: {edge.evidence_strength:.2f}")
             print(f"      Study: {edge.study_type} (n={edge.sample_size})")
 
+    print(f"\n   Found {edge_count} edges across all layers")
+
     # ===== Query 3: Evidence Quality Filter =====
     print("\n\n3. HIGH-QUALITY EVIDENCE: Show me RCT evidence with strength > 0.9")
     print("-" * 70)
-    strong_evidence = session.exec(
-        select(Edge, Paper).join(Paper, Edge.evidence_paper_id == Paper.paper_id).where(Edge.layer == "evidence").where(Edge.study_type == StudyType.RCT.value).where(Edge.evidence_strength > 0.9)
-    ).all()
+    strong_evidence = session.exec(_Q_STRONG_EVIDENCE, params={"study_type": StudyType.RCT.value, "min_strength": 0.9}, execution_options={"yield_per": _YIELD_PER})
 
     for evidence, paper in strong_evidence:
         print(f"\n   Paper: {paper.title}")
@@ -391,19 +468,20 @@ def demo_queries(session: Session):
     print("\n\n4. CONTRADICTION DETECTION: Find conflicting claims")
     print("-" * 70)
 
-    # Group claims by subject-predicate-object, check for different polarities
-    claims_by_relationship = {}
-    all_claims = session.exec(select(Edge).where(Edge.layer == "claim")).all()
+    # Group claims by subject-predicate-object, tracking polarities as we go so
+    # single-polarity groups are skipped without re-scanning their claims
+    claims_by_relationship = defaultdict(list)
+    polarities_by_relationship = defaultdict(set)
+    all_claims = session.exec(_Q_ALL_CLAIMS)
 
     for claim in all_claims:
         key = (claim.subject_id, claim.predicate, claim.object_id)
-        if key not in claims_by_relationship:
-            claims_by_relationship[key] = []
         claims_by_relationship[key].append(claim)
+        polarities_by_relationship[key].add(claim.polarity)
 
-    for key, claims_list in claims_by_relationship.items():
-        polarities = {c.polarity for c in claims_list}
+    for key, polarities in polarities_by_relationship.items():
         if len(polarities) > 1:
+            claims_list = claims_by_relationship[key]
             print("\n   ⚠️  CONTRADICTION DETECTED:")
             print(f"   Relationship: {claims_list[0].subject_name} → {claims_list[0].object_name}")
             print("   Different papers disagree:")
@@ -417,11 +495,10 @@ def demo_queries(session: Session):
     print("-" * 70)
 
     # Get one of each type for the same relationship
-    extraction_edge = session.exec(select(Edge).where(Edge.layer == "extraction").where(Edge.subject_id == "RxNorm:1187832")).first()
-
-    claim_edge = session.exec(select(Edge).where(Edge.layer == "claim").where(Edge.subject_id == "RxNorm:1187832").where(Edge.polarity == Polarity.SUPPORTS.value)).first()
-
-    evidence_edge = session.exec(select(Edge).where(Edge.layer == "evidence").where(Edge.subject_id == "RxNorm:1187832")).first()
+    edges_by_layer = {edge.layer: edge for edge in session.exec(_Q_PROVENANCE_CHAIN, params={"subject_id": "RxNorm:1187832", "claim_polarity": Polarity.SUPPORTS.value})}
+    extraction_edge = edges_by_layer.get("extraction")
+    claim_edge = edges_by_layer.get("claim")
+    evidence_edge = edges_by_layer.get("evidence")
 
     print(f"\n   Relationship: {claim_edge.subject_name} → {claim_edge.object_name}")
     print("\n   [1. EXTRACTION LAYER]")
@@ -443,7 +520,7 @@ def demo_queries(session: Session):
     print("\n\n6. LAYER-BASED FILTERING: Query by layer type")
     print("-" * 70)
 
-    edges = session.exec(select(Edge).where(Edge.subject_id == "RxNorm:1187832").limit(3)).all()
+    edges = session.exec(_Q_EDGES_BY_SUBJECT, params={"subject_id": "RxNorm:1187832"}).all()
 
     print(f"\n   Retrieved {len(edges)} edges:")
     for edge in edges:
@@ -6,7 +6,9 @@ Sync tool to load existing paper JSON files into PostgreSQL with vector embeddin
 import argparse
 import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_community.embeddings import HuggingFaceEmbeddings
 
@@ -17,6 +19,46 @@ except ImportError:
     from ingest_papers import PostgresDatabase
 
 
+def embed_missing_entities(entities: List[Dict[str, Any]], embeddings: HuggingFaceEmbeddings, cache: Dict[Tuple[str, str], List[float]]) -> None:
+    """
+    Fill in missing entity embeddings, reusing vectors already computed for earlier papers.
+
+    The same entity (e.g. "disease: Diabetes") recurs across many papers, so vectors are
+    cached by ``(type, lowercased name)``. Cache misses are embedded together in a single
+    ``embed_documents`` call, since single-item calls pay the full tokenizer + forward-pass
+    overhead per entity.
+
+    Args:
+        entities: Entity dicts from a paper JSON; updated in place
+        embeddings: Embedding model
+        cache: Embeddings already computed in this run, keyed by ``(type, lowercased name)``
+    """
+    to_embed = [entity for entity in entities if entity.get("embedding") is None]
+
+    # Deduplicate cache misses so each distinct entity hits the model once.
+    missing: Dict[Tuple[str, str], str] = {}
+    for entity in to_embed:
+        key = (entity["type"], entity["name"].lower())
+        if key not in cache and key not in missing:
+            missing[key] = f"{entity['type']}: {entity['name']}"
+
+    if missing:
+        vectors = embeddings.embed_documents(list(missing.values()))
+        cache.update(zip(missing.keys(), vectors))
+
+    for entity in to_embed:
+        entity["embedding"] = cache[(entity["type"], entity["name"].lower())]
+
+
+def _finish_sync(future: Future, paper_name: str) -> None:
+    """Wait for a pending PostgreSQL write and report its outcome."""
+    try:
+        future.result()
+        print(f"  ✓ Synced {paper_name}")
+    except Exception as e:
+        print(f"  × Error syncing {paper_name}: {e}")
+
+
 def sync_papers(papers_dir: Path, db_url: str, embedding_model: str):
     print(f"Syncing papers from {papers_dir} to PostgreSQL...")
 
@@ -26,33 +68,42 @@ def sync_papers(papers_dir: Path, db_url: str, embedding_model: str):
     print(f"Loading embeddings: {embedding_model}")
     embeddings = HuggingFaceEmbeddings(model_name=embedding_model, model_kwargs={"device": "cpu"}, encode_kwargs={"normalize_embeddings": True})
 
+    # Embeddings computed so far, shared across papers
+    embedding_cache: Dict[Tuple[str, str], List[float]] = {}
+
     paper_files = list(papers_dir.glob("*.json"))
     print(f"Found {len(paper_files)} papers.")
 
-    for idx, paper_file in enumerate(paper_files, 1):
-        print(f"[{idx}/{len(paper_files)}] Processing {paper_file.name}...")
-        try:
-            with open(paper_file, "r") as f:
-                data = json.load(f)
-
-            # Extract entities and generate embeddings if missing
-            entities = data.get("entities", [])
-            for entity in entities:
-                if "embedding" not in entity or entity["embedding"] is None:
-                    search_text = f"{entity['type']}: {entity['name']}"
-                    entity["embedding"] = embeddings.embed_query(search_text)
-
-            # Ensure predicates are lowercase
-            relationships = data.get("relationships", [])
-            for rel in relationships:
-                rel["predicate"] = rel["predicate"].lower()
+    # Embedding is CPU-bound and PostgreSQL writes are I/O-bound, so a single writer
+    # thread saves paper N while the main thread parses and embeds paper N+1. Only one
+    # write is ever in flight, which keeps writes ordered and memory bounded.
+    pending: Optional[Tuple[Future, str]] = None
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        for idx, paper_file in enumerate(paper_files, 1):
+            print(f"[{idx}/{len(paper_files)}] Processing {paper_file.name}...")
+            try:
+                with open(paper_file, "r") as f:
+                    data = json.load(f)
+
+                # Extract entities and generate embeddings if missing
+                embed_missing_entities(data.get("entities", []), embeddings, embedding_cache)
+
+                # Ensure predicates are lowercase
+                relationships = data.get("relationships", [])
+                for rel in relationships:
+                    rel["predicate"] = rel["predicate"].lower()
+
+            except Exception as e:
+                print(f"  × Error syncing {paper_file.name}: {e}")
+                continue
 
             # Save to PostgreSQL
-            db.save_paper_results(data)
-            print(f"  ✓ Synced {paper_file.name}")
+            if pending:
+                _finish_sync(*pending)
+            pending = (writer.submit(db.save_paper_results, data), paper_file.name)
 
-        except Exception as e:
-            print(f"  × Error syncing {paper_file.name}: {e}")
+        if pending:
+            _finish_sync(*pending)
 
     print("\nSync completed.")
 
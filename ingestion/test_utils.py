@@ -33,6 +33,26 @@ def test_jsonl_write_read():
     print("✓ JSONL write/read test passed")
 
 
+def test_count_jsonl_skips_blank_lines():
+    """Test that count_jsonl ignores blank lines and counts an unterminated last record."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "test.jsonl"
+
+        output_path.write_text('\n{"id": "1"}\n\n\n{"id": "2"}\r\n\r\n{"id": "3"}')
+        assert count_jsonl(output_path) == 3
+
+        output_path.write_text("")
+        assert count_jsonl(output_path) == 0
+
+        assert count_jsonl(Path(tmpdir) / "missing.jsonl") == 0
+
+        # Whitespace-only lines are not records, for count_jsonl as for read_jsonl
+        output_path.write_text('\n  \n{"id": "1"}\n\t\n')
+        assert count_jsonl(output_path) == len(list(read_jsonl(output_path))) == 1
+
+    print("✓ JSONL count test passed")
+
+
 def test_provenance():
     """Test provenance creation."""
     pipeline_info = PipelineInfo(name="test_pipeline", version="1.0.0", stage="stage1")
@@ -61,5 +81,6 @@ def test_provenance():
 
 if __name__ == "__main__":
     test_jsonl_write_read()
+    test_count_jsonl_skips_blank_lines()
     test_provenance()
     print("\n✅ All utility tests passed!")
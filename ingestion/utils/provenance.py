@@ -8,11 +8,16 @@ Adapted from hiv-controversy branch with current schema.
 import platform
 import socket
 import subprocess
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+# Execution context that is invariant for the life of the process
+_HOSTNAME = socket.gethostname()
+_PYTHON_VERSION = platform.python_version()
+
 
 @dataclass
 class GitInfo:
@@ -63,8 +68,24 @@ class ExecutionInfo:
     duration_seconds: Optional[float] = None
 
 
+def _shallow_dict(info: Any) -> Dict[str, Any]:
+    """
+    Convert a flat provenance dataclass to a dict.
+
+    Unlike ``dataclasses.asdict`` this does not recursively deep-copy field
+    values, which is unnecessary for these flat records of scalars.
+    """
+    return {f.name: getattr(info, f.name) for f in fields(info)}
+
+
+@lru_cache(maxsize=1)
 def get_git_info() -> GitInfo:
-    """Get current git repository information."""
+    """
+    Get current git repository information.
+
+    The result is cached for the life of the process: HEAD does not change
+    mid-run, and each lookup otherwise forks ``git`` four times.
+    """
     try:
         # Get repo root
         repo_root = Path(__file__).parent.parent.parent
@@ -105,23 +126,23 @@ def create_provenance(
     if start_time and end_time:
         duration = (end_time - start_time).total_seconds()
 
-    execution_info = ExecutionInfo(timestamp=datetime.now().isoformat(), hostname=socket.gethostname(), python_version=platform.python_version(), duration_seconds=duration)
+    execution_info = ExecutionInfo(timestamp=datetime.now().isoformat(), hostname=_HOSTNAME, python_version=_PYTHON_VERSION, duration_seconds=duration)
 
     provenance = {
         "extraction_pipeline": {
-            **asdict(pipeline_info),
+            **_shallow_dict(pipeline_info),
             "git_commit": git_info.commit,
             "git_commit_short": git_info.commit_short,
             "git_branch": git_info.branch,
             "git_dirty": git_info.dirty,
             "repo_url": git_info.repo_url,
         },
-        "model": asdict(model_info),
-        "execution": asdict(execution_info),
+        "model": _shallow_dict(model_info),
+        "execution": _shallow_dict(execution_info),
     }
 
     if prompt_info:
-        provenance["prompt"] = asdict(prompt_info)
+        provenance["prompt"] = _shallow_dict(prompt_info)
 
     return provenance
 
@@ -13,13 +13,139 @@ Transport: stdio (connects to AI assistants via standard input/output)
 """
 
 import asyncio
+import io
 import json
+import os
+import stat
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, ClassVar, Dict, List, Optional, Set, Tuple
 
 # Add parent directory to path to import from src
 from client.python.client import MedicalGraphClient
 
+try:
+    # orjson (pulled in by chromadb) parses and serializes stdio messages several times faster
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj).encode()
+
+
+# Maximum number of requests handled concurrently
+MAX_CONCURRENT_REQUESTS = 16
+
+# Maximum size of a single request line read from stdin
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+# Maximum number of tool-call responses kept in the response cache
+RESPONSE_CACHE_SIZE = 256
+
+# Seconds a cached tool-call response is served before the backend is asked again
+RESPONSE_CACHE_TTL = 300
+
+# Number of chunk_text characters shown per result when the backend sends no preview
+PREVIEW_CHARS = 300
+
+
+def _stdin_is_pipe() -> bool:
+    """Return True if stdin is a pipe or socket that can be attached to the event loop.
+
+    epoll refuses regular files and character devices such as /dev/null, and uvloop
+    aborts the process on them, so only these two kinds are read through the loop.
+    """
+    try:
+        mode = os.fstat(sys.stdin.fileno()).st_mode
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
+
+
+# Tool definitions for MCP protocol. Immutable, so built once at import.
+TOOLS: List[Dict[str, Any]] = [
+    {
+        "name": "pubmed_graph_search",
+        "description": "Multi-hop reasoning across medical papers. Connects evidence chains that no single paper describes (e.g., Gene → Protein → Pathway → Drug). "
+        "Returns entities, relationships, and supporting evidence with paragraph-level citations.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Natural language query (e.g., 'What drugs treat BRCA1-mutated breast cancer?')",
+                },
+                "max_depth": {
+                    "type": "integer",
+                    "description": "Maximum traversal depth for multi-hop reasoning (1-3, default: 2)",
+                    "default": 2,
+                },
+                "min_confidence": {
+                    "type": "number",
+                    "description": "Minimum confidence score for relationships (0.0-1.0, default: 0.7)",
+                    "default": 0.7,
+                },
+            },
+            "required": ["query"],
+        },
+    },
+    {
+        "name": "diagnostic_chain_trace",
+        "description": "Follow diagnostic reasoning chains from symptoms to diagnoses to treatments. Useful for complex multi-system presentations that don't fit textbook patterns. "
+        "Returns diagnostic pathways with evidence strength.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "symptoms": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of clinical findings/symptoms (e.g., ['elevated ALP', 'fatigue', 'photosensitive rash'])",
+                },
+                "context": {
+                    "type": "string",
+                    "description": "Additional clinical context (age, gender, history, labs, etc.)",
+                    "default": "",
+                },
+            },
+            "required": ["symptoms"],
+        },
+    },
+    {
+        "name": "evidence_contradiction_check",
+        "description": "Find contradictory evidence in the literature. Shows both supporting and contradicting studies with evidence quality (study design, sample size, recency). "
+        "Useful for understanding evolving medical consensus.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "claim": {
+                    "type": "string",
+                    "description": "Medical claim or question to check (e.g., 'Does aspirin prevent heart attacks in primary prevention?')",
+                },
+                "include_meta_analyses": {
+                    "type": "boolean",
+                    "description": "Include systematic reviews and meta-analyses",
+                    "default": True,
+                },
+            },
+            "required": ["claim"],
+        },
+    },
+]
+
+# Complete tools/list response, serialized once. The request id is substituted into
+# the "%b" placeholder, so the transport answers tools/list without re-serializing TOOLS.
+_TOOLS_LIST_RESPONSE_TEMPLATE: bytes = _dumps({"tools": TOOLS}).replace(b"%", b"%%")[:-1] + b',"id":%b,"jsonrpc":"2.0"}'
+
+# JSON-RPC reply to a line that parses but is not a request object; its id is unknown
+_INVALID_REQUEST_RESPONSE: bytes = _dumps({"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}})
+
 
 class MCPServer:
     """MCP Server for medical literature reasoning.
@@ -42,75 +168,12 @@ class MCPServer:
         self.server_url = server_url
         self.client: Optional[MedicalGraphClient] = None
 
+        # LRU cache of successful tool-call responses, keyed by tool name and arguments;
+        # each entry holds its expiry time (time.monotonic) and the response
+        self._response_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+
         # Tool definitions for MCP protocol
-        self.tools = [
-            {
-                "name": "pubmed_graph_search",
-                "description": "Multi-hop reasoning across medical papers. Connects evidence chains that no single paper describes (e.g., Gene → Protein → Pathway → Drug). "
-                "Returns entities, relationships, and supporting evidence with paragraph-level citations.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Natural language query (e.g., 'What drugs treat BRCA1-mutated breast cancer?')",
-                        },
-                        "max_depth": {
-                            "type": "integer",
-                            "description": "Maximum traversal depth for multi-hop reasoning (1-3, default: 2)",
-                            "default": 2,
-                        },
-                        "min_confidence": {
-                            "type": "number",
-                            "description": "Minimum confidence score for relationships (0.0-1.0, default: 0.7)",
-                            "default": 0.7,
-                        },
-                    },
-                    "required": ["query"],
-                },
-            },
-            {
-                "name": "diagnostic_chain_trace",
-                "description": "Follow diagnostic reasoning chains from symptoms to diagnoses to treatments. Useful for complex multi-system presentations that don't fit textbook patterns. "
-                "Returns diagnostic pathways with evidence strength.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "symptoms": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of clinical findings/symptoms (e.g., ['elevated ALP', 'fatigue', 'photosensitive rash'])",
-                        },
-                        "context": {
-                            "type": "string",
-                            "description": "Additional clinical context (age, gender, history, labs, etc.)",
-                            "default": "",
-                        },
-                    },
-                    "required": ["symptoms"],
-                },
-            },
-            {
-                "name": "evidence_contradiction_check",
-                "description": "Find contradictory evidence in the literature. Shows both supporting and contradicting studies with evidence quality (study design, sample size, recency). "
-                "Useful for understanding evolving medical consensus.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "claim": {
-                            "type": "string",
-                            "description": "Medical claim or question to check (e.g., 'Does aspirin prevent heart attacks in primary prevention?')",
-                        },
-                        "include_meta_analyses": {
-                            "type": "boolean",
-                            "description": "Include systematic reviews and meta-analyses",
-                            "default": True,
-                        },
-                    },
-                    "required": ["claim"],
-                },
-            },
-        ]
+        self.tools = TOOLS
 
     async def initialize(self) -> bool:
         """Initialize Medical Graph client.
@@ -144,6 +207,9 @@ class MCPServer:
     async def handle_list_tools(self) -> Dict[str, Any]:
         """Handle tools/list request.
 
+        The stdio transport answers tools/list from a pre-serialized response; this method
+        serves programmatic callers.
+
         Returns:
             Dict[str, Any]: A dictionary containing the list of available tools.
         """
@@ -152,7 +218,9 @@ class MCPServer:
     async def handle_call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/call request.
 
-        Routes to appropriate tool handler based on tool_name.
+        Routes to appropriate tool handler based on tool_name. The Medical Graph client is
+        synchronous, so handlers run its HTTP calls on a worker thread to keep the event loop
+        free for other in-flight requests.
 
         Args:
             tool_name (str): The name of the tool to call.
@@ -167,18 +235,48 @@ class MCPServer:
                 "isError": True,
             }
 
+        # Repeated calls (same tool, exactly the same arguments) within RESPONSE_CACHE_TTL
+        # seconds are answered from the cache without touching the backend. Copies are
+        # returned because callers add the request id and jsonrpc fields to the response.
+        cache_key = json.dumps([tool_name, arguments], sort_keys=True, default=str)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_result = cached
+            if time.monotonic() < expires_at:
+                self._response_cache.move_to_end(cache_key)
+                return dict(cached_result)
+            del self._response_cache[cache_key]
+
+        result = await self._call_tool(tool_name, arguments)
+
+        # Only successful responses are cached, so transient backend errors are retried
+        if not result.get("isError"):
+            self._response_cache[cache_key] = (time.monotonic() + RESPONSE_CACHE_TTL, result)
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+        return dict(result)
+
+    async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a tool handler, converting failures into MCP error results.
+
+        Args:
+            tool_name (str): The name of the tool to call.
+            arguments (Dict[str, Any]): The arguments for the tool.
+
+        Returns:
+            Dict[str, Any]: The result of the tool execution.
+        """
+        handler = self._TOOL_HANDLERS.get(tool_name)
+        if handler is None:
+            return {
+                "content": [{"type": "text", "text": f"Error: Unknown tool '{tool_name}'"}],
+                "isError": True,
+            }
+
         try:
-            if tool_name == "pubmed_graph_search":
-                return await self._handle_graph_search(arguments)
-            elif tool_name == "diagnostic_chain_trace":
-                return await self._handle_diagnostic_chain(arguments)
-            elif tool_name == "evidence_contradiction_check":
-                return await self._handle_contradiction_check(arguments)
-            else:
-                return {
-                    "content": [{"type": "text", "text": f"Error: Unknown tool '{tool_name}'"}],
-                    "isError": True,
-                }
+            return await handler(self, arguments)
         except Exception as e:
             self._log_error(f"Tool call failed: {e}")
             return {
@@ -210,7 +308,7 @@ class MCPServer:
 
         # For now, use hybrid search as a placeholder
         # TODO: Replace with actual graph traversal implementation using MedicalGraphClient methods
-        results_dict = self.client.execute_raw({}) if self.client else {"results": []}
+        results_dict = await asyncio.to_thread(self.client.execute_raw, {}) if self.client else {"results": []}
         results = results_dict.get("results", [])
 
         # Format results
@@ -239,7 +337,7 @@ class MCPServer:
 
         self._log_info(f"Diagnostic chain: symptoms={symptoms}, context='{context}'")
 
-        results_dict = self.client.search_by_symptoms(symptoms=symptoms) if self.client else {"results": []}
+        results_dict = await asyncio.to_thread(self.client.search_by_symptoms, symptoms=symptoms) if self.client else {"results": []}
         results = results_dict.get("results", [])
 
         formatted_results = self._format_diagnostic_results(results, symptoms)
@@ -269,7 +367,7 @@ class MCPServer:
 
         # TODO: Replace with contradiction detection logic using MedicalGraphClient methods
         # For now, execute a raw empty query as a placeholder to resolve no-member error.
-        results_dict = self.client.execute_raw({}) if self.client else {"results": []}
+        results_dict = await asyncio.to_thread(self.client.execute_raw, {}) if self.client else {"results": []}
         results = results_dict.get("results", [])
 
         formatted_results = self._format_contradiction_results(results, claim)
@@ -289,21 +387,22 @@ class MCPServer:
         if not results:
             return f"No results found for: {query}"
 
-        output = [f"## Graph Search Results for: {query}\n"]
-        output.append(f"Found {len(results)} relevant passages:\n")
+        buf = io.StringIO()
+        write = buf.write
+        write(f"## Graph Search Results for: {query}\n\n")
+        write(f"Found {len(results)} relevant passages:\n")
 
-        for i, result in enumerate(results[:10], 1):
-            pmc_id = result.get("pmc_id", "Unknown")
-            title = result.get("title", "Untitled")
-            section = result.get("section", "unknown")
-            score = result.get("score", 0.0)
-            chunk_text = result.get("chunk_text", "")[:300]  # First 300 chars
+        for i, result in enumerate(islice(results, 10), 1):
+            get = result.get
+            pmc_id = get("pmc_id", "Unknown")
+            title = get("title", "Untitled")
+            section = get("section", "unknown")
+            score = get("score", 0.0)
+            chunk_text = get("preview") or get("chunk_text", "")[:PREVIEW_CHARS]
 
-            output.append(f"### {i}. {title}")
-            output.append(f"**Source:** {pmc_id} | **Section:** {section} | **Relevance:** {score:.3f}")
-            output.append(f"{chunk_text}...\n")
+            write(f"\n### {i}. {title}\n**Source:** {pmc_id} | **Section:** {section} | **Relevance:** {score:.3f}\n{chunk_text}...\n")
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     def _format_diagnostic_results(self, results: List[Dict[str, Any]], symptoms: List[str]) -> str:
         """Format diagnostic chain results.
@@ -318,20 +417,21 @@ class MCPServer:
         if not results:
             return f"No diagnostic pathways found for: {', '.join(symptoms)}"
 
-        output = [f"## Diagnostic Pathways for: {', '.join(symptoms)}\n"]
-        output.append(f"Found {len(results)} relevant passages:\n")
+        buf = io.StringIO()
+        write = buf.write
+        write(f"## Diagnostic Pathways for: {', '.join(symptoms)}\n\n")
+        write(f"Found {len(results)} relevant passages:\n")
 
         # TODO: Group by diagnosis and rank by evidence strength
-        for i, result in enumerate(results[:10], 1):
-            pmc_id = result.get("pmc_id", "Unknown")
-            title = result.get("title", "Untitled")
-            chunk_text = result.get("chunk_text", "")[:300]
+        for i, result in enumerate(islice(results, 10), 1):
+            get = result.get
+            pmc_id = get("pmc_id", "Unknown")
+            title = get("title", "Untitled")
+            chunk_text = get("preview") or get("chunk_text", "")[:PREVIEW_CHARS]
 
-            output.append(f"### {i}. {title}")
-            output.append(f"**Source:** {pmc_id}")
-            output.append(f"{chunk_text}...\n")
+            write(f"\n### {i}. {title}\n**Source:** {pmc_id}\n{chunk_text}...\n")
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     def _format_contradiction_results(self, results: List[Dict[str, Any]], claim: str) -> str:
         """Format contradiction check results.
@@ -346,20 +446,23 @@ class MCPServer:
         if not results:
             return f"No evidence found for: {claim}"
 
-        output = [f"## Evidence Analysis for: {claim}\n"]
-        output.append(f"Found {len(results)} relevant studies:\n")
+        buf = io.StringIO()
+        write = buf.write
+        write(f"## Evidence Analysis for: {claim}\n\n")
+        write(f"Found {len(results)} relevant studies:\n\n")
 
         # TODO: Group into supporting/contradicting/neutral
-        output.append("### Studies Found:\n")
-        for i, result in enumerate(results[:15], 1):
-            pmc_id = result.get("pmc_id", "Unknown")
-            title = result.get("title", "Untitled")
+        write("### Studies Found:\n")
+        for i, result in enumerate(islice(results, 15), 1):
+            get = result.get
+            pmc_id = get("pmc_id", "Unknown")
+            title = get("title", "Untitled")
 
-            output.append(f"{i}. **{title}** ({pmc_id})")
+            write(f"\n{i}. **{title}** ({pmc_id})")
 
-        output.append("\n_Note: Full contradiction analysis coming soon._")
+        write("\n\n_Note: Full contradiction analysis coming soon._")
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle incoming MCP request.
@@ -374,20 +477,118 @@ class MCPServer:
         """
         method = request.get("method", "")
 
-        if method == "tools/list":
-            return await self.handle_list_tools()
-        elif method == "tools/call":
-            params = request.get("params", {})
-            tool_name = params.get("name", "")
-            arguments = params.get("arguments", {})
-            return await self.handle_call_tool(tool_name, arguments)
-        else:
+        handler = self._METHOD_HANDLERS.get(method)
+        if handler is None:
             return {"error": {"code": -32601, "message": f"Method not found: {method}"}}
 
+        return await handler(self, request)
+
+    async def _handle_tools_list(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a tools/list request.
+
+        Args:
+            request (Dict[str, Any]): The incoming request dictionary.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing the list of available tools.
+        """
+        return await self.handle_list_tools()
+
+    async def _handle_tools_call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a tools/call request.
+
+        Args:
+            request (Dict[str, Any]): The incoming request dictionary.
+
+        Returns:
+            Dict[str, Any]: The result of the tool execution.
+        """
+        params = request.get("params", {})
+        tool_name = params.get("name", "")
+        arguments = params.get("arguments", {})
+        return await self.handle_call_tool(tool_name, arguments)
+
+    async def _read_stdin_lines(self) -> AsyncIterator[bytes]:
+        """Yield raw request lines from stdin without blocking the event loop.
+
+        When stdin is a pipe or socket it is attached to the loop, so reads are awaited
+        rather than blocking. Anything else (a regular file, /dev/null, or an event loop
+        without pipe support) is read line by line on a worker thread instead.
+
+        Yields:
+            bytes: One line from stdin, including its trailing newline.
+        """
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=MAX_REQUEST_BYTES)
+        attached = False
+        if _stdin_is_pipe():
+            try:
+                await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+                attached = True
+            except (NotImplementedError, ValueError, OSError):
+                pass
+
+        if not attached:
+            while line := await asyncio.to_thread(sys.stdin.buffer.readline):
+                yield line
+            return
+
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError as e:
+                # The line exceeded MAX_REQUEST_BYTES; the reader drops it, so keep going
+                self._log_error(f"Request too long, skipped: {e}")
+                continue
+            if not line:
+                return
+            yield line
+
+    def _write_message(self, message: bytes) -> None:
+        """Write one serialized JSON-RPC message to stdout.
+
+        The write is synchronous on the event loop thread, so messages from concurrent
+        tasks cannot interleave.
+
+        Args:
+            message (bytes): The serialized message, without a trailing newline.
+        """
+        # Written as two pieces so large responses are not copied just to append the newline
+        sys.stdout.buffer.writelines((message, b"\n"))
+        sys.stdout.buffer.flush()
+
+    async def _dispatch(self, request: Dict[str, Any], semaphore: asyncio.Semaphore) -> None:
+        """Handle one request and write its response to stdout.
+
+        Runs as its own task so that independent requests are handled concurrently.
+
+        Args:
+            request (Dict[str, Any]): The parsed request dictionary.
+            semaphore (asyncio.Semaphore): Bounds the number of in-flight requests; released when done.
+        """
+        try:
+            response = await self.handle_request(request)
+
+            # Add request ID if present
+            if "id" in request:
+                response["id"] = request["id"]
+
+            response["jsonrpc"] = "2.0"
+
+            self._write_message(_dumps(response))
+
+        except Exception as e:
+            self._log_error(f"Error processing request: {e}")
+        finally:
+            semaphore.release()
+
     async def run(self) -> None:
         """Main server loop - reads from stdin, writes to stdout.
 
-        Implements stdio transport for MCP protocol.
+        Implements stdio transport for MCP protocol. Each request is dispatched as a separate
+        task, so independent tool calls overlap their backend I/O instead of queuing behind
+        each other; responses carry their request ``id`` and may be written out of order.
+        At most MAX_CONCURRENT_REQUESTS requests are in flight at once.
         """
         self._log_info("MCP Server starting...")
 
@@ -398,45 +599,81 @@ class MCPServer:
 
         self._log_info("MCP Server ready")
 
-        # Read from stdin, write to stdout
-        while True:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        tasks: Set[asyncio.Task] = set()
+
+        # Read from stdin, dispatch each request concurrently
+        async for line in self._read_stdin_lines():
+            if line.isspace():
+                continue
+
+            # JSONDecodeError and UnicodeDecodeError (invalid UTF-8) are both ValueErrors
             try:
-                line = sys.stdin.readline()
-                if not line:
-                    break  # EOF
+                request = _loads(line)
+            except ValueError as e:
+                self._log_error(f"Invalid JSON: {e}")
+                continue
 
-                request = json.loads(line.strip())
-                self._log_info(f"Request: {request.get('method', 'unknown')}")
+            # Valid JSON that is not a request object (e.g. an array or a number)
+            if not isinstance(request, dict):
+                self._log_error(f"Invalid request: expected a JSON object, got {type(request).__name__}")
+                self._write_message(_INVALID_REQUEST_RESPONSE)
+                continue
 
-                response = await self.handle_request(request)
+            self._log_info(f"Request: {request.get('method', 'unknown')}")
 
-                # Add request ID if present
-                if "id" in request:
-                    response["id"] = request["id"]
+            # tools/list never changes, so it is answered inline from the pre-serialized response
+            if request.get("method") == "tools/list" and "id" in request:
+                self._write_message(_TOOLS_LIST_RESPONSE_TEMPLATE % _dumps(request["id"]))
+                continue
 
-                response["jsonrpc"] = "2.0"
+            # Stop reading once the concurrency limit is reached (backpressure)
+            await semaphore.acquire()
+            task = asyncio.create_task(self._dispatch(request, semaphore))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
 
-                # Write response to stdout
-                print(json.dumps(response), flush=True)
+        # EOF: let in-flight requests finish before shutting down
+        if tasks:
+            await asyncio.gather(*tasks)
 
-            except json.JSONDecodeError as e:
-                self._log_error(f"Invalid JSON: {e}")
-            except Exception as e:
-                self._log_error(f"Error processing request: {e}")
+    # Routing tables, keyed by tool name and by JSON-RPC method. Values are the unbound handler functions.
+    _TOOL_HANDLERS: ClassVar[Dict[str, Callable[["MCPServer", Dict[str, Any]], Awaitable[Dict[str, Any]]]]] = {
+        "pubmed_graph_search": _handle_graph_search,
+        "diagnostic_chain_trace": _handle_diagnostic_chain,
+        "evidence_contradiction_check": _handle_contradiction_check,
+    }
+
+    _METHOD_HANDLERS: ClassVar[Dict[str, Callable[["MCPServer", Dict[str, Any]], Awaitable[Dict[str, Any]]]]] = {
+        "tools/list": _handle_tools_list,
+        "tools/call": _handle_tools_call,
+    }
 
 
 def main():
     """Entry point for MCP server"""
-    import os
-
     # Get Backend API config from environment
     server_url = os.getenv("MEDGRAPH_SERVER", "http://localhost:8000")
 
     # Create and run server
     server = MCPServer(server_url=server_url)
 
+    # uvloop (installed with uvicorn[standard]) schedules tasks and pipe I/O faster than the default loop
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
     # Run async event loop
-    asyncio.run(server.run())
+    if uvloop is None:
+        asyncio.run(server.run())
+    elif sys.version_info >= (3, 11):
+        # Pass the loop factory directly; event loop policies are deprecated on newer Pythons
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(server.run())
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(server.run())
 
 
 if __name__ == "__main__":
@@ -10,10 +10,79 @@ This module parses the client/curl/EXAMPLES.md file to extract:
 The extracted data is used to populate the dropdown in the web UI.
 """
 
+import hashlib
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+try:
+    # orjson (pulled in by chromadb) parses noticeably faster; its JSONDecodeError
+    # subclasses json.JSONDecodeError, so error handling is unchanged
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Example sections look like "## Example 1: ..." and run until the next "##" header
+EXAMPLE_PATTERN = re.compile(r"## (Example \d+:.*?)(?=\n##|\Z)", re.DOTALL)
+
+RESPONSE_PATTERN = re.compile(r'```json\s*\n({\s*"results".*?})\s*```', re.DOTALL)
+
+
+def _extract_curl_json(section: str) -> Optional[str]:
+    """
+    Find the JSON object passed to curl with ``-d`` in an example section.
+
+    Walks the section once: at each ``-d`` followed by whitespace and an optional
+    quote, an opening ``{`` starts a scan that tracks brace depth, skipping braces
+    inside JSON strings, until the object closes. Payloads that are not inline JSON
+    (e.g. ``-d @query.json``) are passed over.
+
+    Args:
+        section: Markdown text of one example
+
+    Returns:
+        The JSON object text, or None if the section has no inline JSON payload
+    """
+    length = len(section)
+    pos = section.find("-d")
+    while pos != -1:
+        i = pos + 2
+        if i < length and section[i].isspace():
+            while i < length and section[i].isspace():
+                i += 1
+            if i < length and section[i] in "'\"":
+                i += 1
+            while i < length and section[i].isspace():
+                i += 1
+
+            if i < length and section[i] == "{":
+                start = i
+                depth = 0
+                in_string = False
+                escape = False
+                while i < length:
+                    char = section[i]
+                    if in_string:
+                        if escape:
+                            escape = False
+                        elif char == "\\":
+                            escape = True
+                        elif char == '"':
+                            in_string = False
+                    elif char == '"':
+                        in_string = True
+                    elif char == "{":
+                        depth += 1
+                    elif char == "}":
+                        depth -= 1
+                        if depth == 0:
+                            return section[start : i + 1]
+                    i += 1
+                return None
+
+        pos = section.find("-d", pos + 2)
+    return None
 
 
 def parse_examples_md(examples_md_path: Path) -> List[Dict[str, Any]]:
@@ -32,11 +101,7 @@ def parse_examples_md(examples_md_path: Path) -> List[Dict[str, Any]]:
     examples = []
 
     # Split content by example sections
-    # Look for headers like "## Example 1: ..." or "## Example 2: ..."
-    example_pattern = r"## (Example \d+:.*?)(?=\n##|\Z)"
-    example_matches = re.finditer(example_pattern, content, re.DOTALL)
-
-    for match in example_matches:
+    for match in EXAMPLE_PATTERN.finditer(content):
         example_section = match.group(0)
         title_raw = match.group(1).strip()
 
@@ -44,38 +109,21 @@ def parse_examples_md(examples_md_path: Path) -> List[Dict[str, Any]]:
         # Remove everything after the first newline or markdown code block
         title = title_raw.split("\n")[0].strip()
 
-        # Extract curl commands with JSON payloads
-        # Look for JSON in single quotes first
-        json_pattern = r"-d\s+\'({.*?})\'"
-
-        # Try to find JSON in single quotes first
-        json_match = re.search(json_pattern, example_section, re.DOTALL)
-
-        if not json_match:
-            # Try double quotes or no quotes
-            json_pattern_alt = r'-d\s+"({.*?})"'
-            json_match = re.search(json_pattern_alt, example_section, re.DOTALL)
-
-        if not json_match:
-            # Try JSON without quotes (multiline)
-            json_pattern_block = r"-d\s+\'?\s*({[^}]*(?:{[^}]*}[^}]*)*})"
-            json_match = re.search(json_pattern_block, example_section, re.DOTALL)
-
-        if json_match:
-            json_str = json_match.group(1).strip()
+        # Extract the curl command's JSON payload
+        json_str = _extract_curl_json(example_section)
 
+        if json_str:
             try:
                 # Parse JSON to validate and pretty-print
-                query_json = json.loads(json_str)
+                query_json = _loads(json_str)
 
                 # Look for expected response
                 expected_response = None
-                response_pattern = r'```json\s*\n({\s*"results".*?})\s*```'
-                response_match = re.search(response_pattern, example_section, re.DOTALL)
+                response_match = RESPONSE_PATTERN.search(example_section)
 
                 if response_match:
                     try:
-                        expected_response = json.loads(response_match.group(1))
+                        expected_response = _loads(response_match.group(1))
                     except json.JSONDecodeError:
                         pass
 
@@ -95,18 +143,55 @@ def parse_examples_md(examples_md_path: Path) -> List[Dict[str, Any]]:
     return examples
 
 
+def _source_key(examples_md_path: Path) -> str:
+    """
+    Content hash of EXAMPLES.md and of this parser, used to detect whether examples.json is stale.
+
+    The parser's own source is part of the key so that a change to the parsing logic
+    regenerates the output even when EXAMPLES.md is unchanged.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(examples_md_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _key_path(output_path: Path) -> Path:
+    """Sidecar file recording which EXAMPLES.md content and parser produced output_path."""
+    return output_path.with_name(output_path.name + ".key")
+
+
+def _read_key(key_path: Path) -> Optional[str]:
+    try:
+        return key_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
 def generate_examples_json(examples_md_path: Path, output_path: Path) -> None:
     """
     Parse EXAMPLES.md and generate examples.json file.
 
+    Parsing is skipped when examples.json already exists and its sidecar key matches
+    the current EXAMPLES.md and parser source. The key lives beside the output rather than
+    inside it, since the UI and the /examples endpoint load examples.json as a plain list.
+
     Args:
         examples_md_path: Path to EXAMPLES.md
         output_path: Path to write examples.json
     """
+    key = _source_key(examples_md_path)
+    key_path = _key_path(output_path)
+
+    if output_path.exists() and _read_key(key_path) == key:
+        print(f"{output_path} is up to date")
+        return
+
     examples = parse_examples_md(examples_md_path)
 
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(examples, f, indent=2)
+    key_path.write_text(key + "\n", encoding="utf-8")
 
     print(f"Generated {output_path} with {len(examples)} examples")
 
@@ -26,7 +26,8 @@ Phase 3 features are documented in QUERY_EXECUTOR_ROADMAP.md
 
 import logging
 import re
-from typing import Any, Dict, List
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set
 
 import psycopg2
 from langchain_community.embeddings import HuggingFaceEmbeddings
@@ -127,20 +128,22 @@ def execute_vector_search_query(query: Dict[str, Any]) -> Dict[str, Any]:
 
         with psycopg2.connect(db_url) as conn:
             with conn.cursor() as cur:
-                # Cosine similarity is 1 - cosine distance (<=>)
+                # Cosine similarity is 1 - cosine distance (<=>). The distance is computed once
+                # per row, and ranking by the bare distance in ascending order is the form
+                # pgvector can serve from a vector index. Applying the similarity threshold
+                # after the top-k cut gives the same rows, since both are monotone in distance.
                 sql = """
-                    SELECT
-                        id,
-                        name,
-                        entity_type,
-                        properties,
-                        1 - (embedding <=> %s::vector) as similarity
-                    FROM entities
-                    WHERE 1 - (embedding <=> %s::vector) > %s
-                    ORDER BY similarity DESC
-                    LIMIT %s
+                    SELECT id, name, entity_type, properties, 1 - distance AS similarity
+                    FROM (
+                        SELECT id, name, entity_type, properties, embedding <=> %s::vector AS distance
+                        FROM entities
+                        ORDER BY distance
+                        LIMIT %s
+                    ) nearest
+                    WHERE distance < %s
+                    ORDER BY distance
                 """
-                cur.execute(sql, (query_embedding, query_embedding, min_similarity, top_k))
+                cur.execute(sql, (query_embedding, top_k, 1 - min_similarity))
 
                 rows = cur.fetchall()
                 for row in rows:
@@ -172,6 +175,25 @@ def execute_vector_search_query(query: Dict[str, Any]) -> Dict[str, Any]:
     return {"results": results}
 
 
+def index_relationships_by_subject(relationships: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Group relationships by subject_id, keeping their original order.
+
+    Lets per-node loops visit only that node's outgoing edges instead of scanning
+    every relationship for each node.
+
+    Args:
+        relationships: List of relationship dictionaries
+
+    Returns:
+        Dictionary mapping subject_id to the relationships with that subject
+    """
+    rels_by_subject: Dict[str, List[Dict]] = defaultdict(list)
+    for rel in relationships:
+        rels_by_subject[rel["subject_id"]].append(rel)
+    return rels_by_subject
+
+
 def execute_node_query(query: Dict[str, Any], entities: Dict[str, Dict], relationships: List[Dict]) -> Dict[str, Any]:
     """
     Execute a node query (original Phase 1 behavior).
@@ -198,17 +220,16 @@ def execute_node_query(query: Dict[str, Any], entities: Dict[str, Dict], relatio
     source_nodes = filter_nodes_by_pattern(entities, node_pattern)
 
     # Step 2: Find matching relationships
+    rels_by_subject = index_relationships_by_subject(relationships)
+    matches_edge = compile_edge_pattern(edge_pattern)
     matches = []
     for node_id in source_nodes:
         node = entities[node_id]
 
         # Find relationships where this node is the subject
-        for rel in relationships:
-            if rel["subject_id"] != node_id:
-                continue
-
+        for rel in rels_by_subject.get(node_id, ()):
             # Check edge_pattern
-            if not matches_edge_pattern(rel, edge_pattern):
+            if not matches_edge(rel):
                 continue
 
             # Get target node
@@ -283,6 +304,58 @@ def filter_nodes_by_pattern(entities: Dict[str, Dict], node_pattern: Dict[str, A
     return matching_ids
 
 
+def compile_edge_pattern(edge_pattern: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build a matcher for an edge_pattern, doing the per-query work once.
+
+    The relation type is upper-cased up front, and each distinct predicate is
+    upper-cased and compared at most once per query, so the hot loop over
+    relationships does a dict lookup instead of two ``str.upper()`` calls.
+
+    Args:
+        edge_pattern: edge_pattern from the query (see matches_edge_pattern)
+
+    Returns:
+        Function taking a relationship and returning True if it matches
+    """
+    if not edge_pattern:
+        return lambda rel: True
+
+    return _compile_edge_match(edge_pattern.get("relation_type"), [], edge_pattern.get("min_confidence"), 0.0)
+
+
+def _compile_edge_match(relation_type: Optional[str], relation_types: List[str], min_confidence: Optional[float], default_confidence: float) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build a relationship matcher shared by edge_pattern and path edge specs.
+
+    Predicates are compared case-insensitively against relation_type (if set) and,
+    when relation_types is non-empty, must also be one of those.
+    """
+    required = relation_type.upper() if relation_type else None
+    allowed = {rt.upper() for rt in relation_types}
+    check_predicate = required is not None or bool(allowed)
+    predicate_ok: Dict[str, bool] = {}
+
+    def matches(rel: Dict[str, Any]) -> bool:
+        if check_predicate:
+            predicate = rel["predicate"]
+            ok = predicate_ok.get(predicate)
+            if ok is None:
+                predicate_upper = predicate.upper()
+                ok = (required is None or predicate_upper == required) and (not allowed or predicate_upper in allowed)
+                predicate_ok[predicate] = ok
+            if not ok:
+                return False
+
+        if min_confidence is not None:
+            if rel.get("confidence", default_confidence) < min_confidence:
+                return False
+
+        return True
+
+    return matches
+
+
 def matches_edge_pattern(rel: Dict[str, Any], edge_pattern: Dict[str, Any]) -> bool:
     """
     Check if a relationship matches the edge_pattern.
@@ -291,24 +364,11 @@ def matches_edge_pattern(rel: Dict[str, Any], edge_pattern: Dict[str, Any]) -> b
     - relation_type: Required relation type (e.g., "TREATS")
     - min_confidence: Minimum confidence threshold
     - direction: "outgoing" or "incoming" (currently only outgoing is supported)
-    """
-    if not edge_pattern:
-        return True
 
-    # Check relation type (case-insensitive)
-    relation_type = edge_pattern.get("relation_type")
-    if relation_type:
-        # Normalize both to uppercase for comparison
-        if rel["predicate"].upper() != relation_type.upper():
-            return False
-
-    # Check min_confidence
-    min_confidence = edge_pattern.get("min_confidence")
-    if min_confidence is not None:
-        if rel.get("confidence", 0.0) < min_confidence:
-            return False
-
-    return True
+    Callers matching many relationships against one pattern should use
+    compile_edge_pattern instead.
+    """
+    return compile_edge_pattern(edge_pattern)(rel)
 
 
 def matches_filters(source: Dict, edge: Dict, target: Dict, filters: List[Dict]) -> bool:
@@ -712,10 +772,11 @@ def execute_edge_query(query: Dict[str, Any], entities: Dict[str, Dict], relatio
     return_fields = query.get("return_fields")
 
     # Find matching relationships
+    matches_edge = compile_edge_pattern(edge_pattern)
     results = []
     for rel in relationships:
         # Check edge_pattern
-        if not matches_edge_pattern(rel, edge_pattern):
+        if not matches_edge(rel):
             continue
 
         # Get source and target nodes
@@ -795,12 +856,25 @@ def execute_path_query(query: Dict[str, Any], entities: Dict[str, Dict], relatio
     # Find start nodes
     start_nodes = filter_nodes_by_pattern(entities, start_spec)
 
+    # Work backwards from the end of the pattern so the forward traversal only
+    # expands nodes that can still complete it
+    can_complete = nodes_completing_pattern(edge_specs, max_hops, entities, relationships)
+    if can_complete:
+        start_nodes = [start_id for start_id in start_nodes if start_id in can_complete[0]]
+
     # Traverse paths
+    rels_by_subject = index_relationships_by_subject(relationships)
+    # Compile the edge spec of each hop the traversal can reach (invalid specs stop it)
+    edge_matchers = []
+    for hop_index, edge_spec_item in enumerate(edge_specs):
+        if hop_index >= max_hops or not is_valid_edge_spec(edge_spec_item):
+            break
+        edge_matchers.append(compile_edge_spec(edge_spec_item[0]))
     paths = []
     for start_id in start_nodes:
         start_node = entities[start_id]
         # Start traversal with empty path
-        traverse_paths(start_node, [], [], edge_specs, 0, max_hops, avoid_cycles, entities, relationships, paths)
+        traverse_paths(start_node, [], [], edge_specs, 0, max_hops, avoid_cycles, entities, rels_by_subject, paths, can_complete, edge_matchers)
 
     # Convert paths to result format
     results = []
@@ -840,6 +914,50 @@ def is_valid_edge_spec(edge_spec_item: Any) -> bool:
     return isinstance(edge_spec_item, (list, tuple)) and len(edge_spec_item) == 2
 
 
+def nodes_completing_pattern(edge_specs: List[List], max_hops: int, entities: Dict[str, Dict], relationships: List[Dict]) -> List[Set[str]]:
+    """
+    Find, for each hop, the nodes from which the rest of the path pattern can be completed.
+
+    This is the backward half of a bidirectional search: starting from the last hop,
+    each step keeps the subjects of matching edges whose target can complete the
+    remaining hops. Cycle avoidance is ignored here, so the sets over-approximate and
+    pruning against them never drops a path the forward traversal would find.
+
+    Args:
+        edge_specs: Edge specifications from path_pattern.edges
+        max_hops: Maximum number of hops allowed
+        entities: All entities in the graph
+        relationships: All relationships in the graph
+
+    Returns:
+        List where entry i holds the ids of nodes that can complete hops i onwards;
+        empty when the pattern has no hops
+    """
+    num_hops = max(0, min(len(edge_specs), max_hops))
+    can_complete: List[Set[str]] = [set() for _ in range(num_hops)]
+
+    # Paths through an invalid edge spec are never completed
+    if not all(is_valid_edge_spec(edge_specs[i]) for i in range(num_hops)):
+        return can_complete
+
+    for hop_index in reversed(range(num_hops)):
+        edge_spec, target_spec = edge_specs[hop_index]
+        matches_edge = compile_edge_spec(edge_spec)
+        next_hop = can_complete[hop_index + 1] if hop_index + 1 < num_hops else None
+        subjects = can_complete[hop_index]
+
+        for rel in relationships:
+            target_id = rel["object_id"]
+            if next_hop is not None and target_id not in next_hop:
+                continue
+            if target_id not in entities or not matches_edge(rel):
+                continue
+            if matches_node_spec(entities[target_id], target_spec):
+                subjects.add(rel["subject_id"])
+
+    return can_complete
+
+
 def traverse_paths(
     current_node: Dict,
     current_path_nodes: List[Dict],
@@ -849,8 +967,11 @@ def traverse_paths(
     max_hops: int,
     avoid_cycles: bool,
     entities: Dict[str, Dict],
-    relationships: List[Dict],
+    rels_by_subject: Dict[str, List[Dict]],
     collected_paths: List,
+    can_complete: Optional[List[Set[str]]] = None,
+    edge_matchers: Optional[List[Callable[[Dict], bool]]] = None,
+    visited_ids: Optional[Set[str]] = None,
 ):
     """
     Recursively traverse paths through the graph.
@@ -864,11 +985,20 @@ def traverse_paths(
         max_hops: Maximum number of hops allowed
         avoid_cycles: Whether to prevent revisiting nodes
         entities: All entities in the graph
-        relationships: All relationships in the graph
+        rels_by_subject: All relationships in the graph, grouped by subject_id
+            (see index_relationships_by_subject)
         collected_paths: Output list to collect completed paths
+        can_complete: Optional result of nodes_completing_pattern; targets that cannot
+            complete the remaining hops are skipped
+        edge_matchers: Optional compile_edge_spec result for each hop, so the edge
+            specs are compiled once per query rather than once per visited node
+        visited_ids: Ids of the nodes in path_nodes, used for O(1) cycle checks; built
+            from the path when omitted and updated in place during the recursion
     """
     # Add current node to path
     path_nodes = current_path_nodes + [current_node]
+    if visited_ids is None:
+        visited_ids = {node["id"] for node in path_nodes}
 
     # Check if we've completed all specified hops
     if hop_index >= len(edge_specs) or hop_index >= max_hops:
@@ -883,14 +1013,12 @@ def traverse_paths(
         return
 
     edge_spec, target_spec = edge_specs[hop_index]
+    matches_edge = edge_matchers[hop_index] if edge_matchers else compile_edge_spec(edge_spec)
 
     # Find matching edges from current node
-    for rel in relationships:
-        if rel["subject_id"] != current_node["id"]:
-            continue
-
+    for rel in rels_by_subject.get(current_node["id"], ()):
         # Check if edge matches the edge_spec
-        if not matches_edge_spec(rel, edge_spec):
+        if not matches_edge(rel):
             continue
 
         # Get target node
@@ -904,36 +1032,34 @@ def traverse_paths(
         if not matches_node_spec(target_node, target_spec):
             continue
 
+        # Skip targets that cannot complete the remaining hops
+        if can_complete and hop_index + 1 < len(can_complete) and target_id not in can_complete[hop_index + 1]:
+            continue
+
         # Check for cycles if needed
-        if avoid_cycles and any(n["id"] == target_id for n in path_nodes):
+        if avoid_cycles and target_id in visited_ids:
             continue
 
         # Continue traversal
         path_edges = current_path_edges + [rel]
-        traverse_paths(target_node, path_nodes, path_edges, edge_specs, hop_index + 1, max_hops, avoid_cycles, entities, relationships, collected_paths)
-
-
-def matches_edge_spec(rel: Dict, edge_spec: Dict) -> bool:
-    """Check if a relationship matches an edge specification from path_pattern."""
-    # Check relation_type
-    relation_type = edge_spec.get("relation_type")
-    relation_types = edge_spec.get("relation_types", [])
+        if avoid_cycles:
+            visited_ids.add(target_id)
+        traverse_paths(target_node, path_nodes, path_edges, edge_specs, hop_index + 1, max_hops, avoid_cycles, entities, rels_by_subject, collected_paths, can_complete, edge_matchers, visited_ids)
+        if avoid_cycles:
+            visited_ids.discard(target_id)
 
-    if relation_type:
-        if rel["predicate"].upper() != relation_type.upper():
-            return False
 
-    if relation_types:
-        if not any(rel["predicate"].upper() == rt.upper() for rt in relation_types):
-            return False
+def compile_edge_spec(edge_spec: Dict) -> Callable[[Dict], bool]:
+    """
+    Build a matcher for an edge specification from path_pattern, doing the per-query
+    work once (see compile_edge_pattern).
+    """
+    return _compile_edge_match(edge_spec.get("relation_type"), edge_spec.get("relation_types", []), edge_spec.get("min_confidence"), 0)
 
-    # Check min_confidence
-    min_confidence = edge_spec.get("min_confidence")
-    if min_confidence is not None:
-        if rel.get("confidence", 0) < min_confidence:
-            return False
 
-    return True
+def matches_edge_spec(rel: Dict, edge_spec: Dict) -> bool:
+    """Check if a relationship matches an edge specification from path_pattern."""
+    return compile_edge_spec(edge_spec)(rel)
 
 
 def matches_node_spec(node: Dict, node_spec: Dict) -> bool:
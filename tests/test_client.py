@@ -47,3 +47,35 @@ def test_medical_graph_client_execute_and_execute_raw(monkeypatch):
     res2 = client.execute(qb)
     assert isinstance(res2, dict)
     assert "results" in res2
+
+
+def test_get_papers_details_fetches_all_ids_in_one_request():
+    client = MedicalGraphClient(base_url="http://example.test", api_key=None, timeout=1)
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"results": []}
+
+    class FakeSession:
+        def __init__(self):
+            self.headers = {}
+            self.calls = []
+
+        def post(self, url, json=None, timeout=None):
+            self.calls.append(json)
+            return FakeResponse()
+
+    client.session = FakeSession()
+    client.get_papers_details(["PMC1", "PMC2", "PMC1"])
+
+    assert len(client.session.calls) == 1
+    query = client.session.calls[0]
+    assert query["filters"] == [{"field": "id", "operator": "in", "value": ["PMC1", "PMC2"]}]
+    assert query["limit"] == 2
+
+    client.session.calls.clear()
+    assert client.get_papers_details([]) == {"results": []}
+    assert client.session.calls == []
@@ -1,4 +1,10 @@
 import asyncio
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 from mcp.server import MCPServer
 
 
@@ -22,9 +28,122 @@ def test_mcp_list_tools_and_formatting():
     assert "Study A" in formatted
 
 
+def test_mcp_formatting_prefers_backend_preview():
+    server = MCPServer(server_url="http://localhost:9200")
+    long_text = "x" * 1000
+    results = [{"pmc_id": "PMC111", "title": "Study A", "chunk_text": long_text}]
+    assert "x" * 300 + "..." in server._format_search_results(results, "q")
+    assert "x" * 301 not in server._format_search_results(results, "q")
+
+    results[0]["preview"] = "Short preview"
+    assert "Short preview..." in server._format_diagnostic_results(results, ["fever"])
+
+
 def test_mcp_initialize_sets_client():
     server = MCPServer(server_url="http://localhost:9200")
     ok = asyncio.run(server.initialize())
     # initialize simply constructs the MedicalGraphClient inside; it should return True on success
     assert ok is True
     assert server.client is not None
+
+
+def test_mcp_run_answers_each_request_over_stdio():
+    # run() dispatches requests concurrently, so match responses by id rather than order
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+        {"jsonrpc": "2.0", "id": 2, "method": "no/such/method"},
+    ]
+    stdin = "".join(json.dumps(r) + "\n" for r in requests) + "{not json\n"
+    proc = subprocess.run(
+        [sys.executable, "-c", "from mcp.server import main; main()"],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        cwd=Path(__file__).parent.parent,
+        env={**os.environ, "MEDGRAPH_SERVER": "http://localhost:9200"},
+    )
+    assert proc.returncode == 0, proc.stderr
+
+    responses = {r["id"]: r for r in map(json.loads, proc.stdout.splitlines())}
+    assert set(responses) == {1, 2}
+    assert responses[1]["jsonrpc"] == "2.0"
+    assert [t["name"] for t in responses[1]["tools"]] == ["pubmed_graph_search", "diagnostic_chain_trace", "evidence_contradiction_check"]
+    assert responses[2]["error"]["code"] == -32601
+    assert "Invalid JSON" in proc.stderr
+
+
+def test_mcp_run_survives_non_object_request_lines():
+    # Valid JSON that is not an object, and invalid UTF-8, must not stop the server
+    stdin = b'[1, 2]\n\xff\xfe\n{"jsonrpc": "2.0", "id": 7, "method": "no/such/method"}\n'
+    proc = subprocess.run(
+        [sys.executable, "-c", "from mcp.server import main; main()"],
+        input=stdin,
+        capture_output=True,
+        timeout=30,
+        cwd=Path(__file__).parent.parent,
+        env={**os.environ, "MEDGRAPH_SERVER": "http://localhost:9200"},
+    )
+    assert proc.returncode == 0, proc.stderr
+
+    responses = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert responses[0] == {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+    assert responses[1]["id"] == 7
+    assert responses[1]["error"]["code"] == -32601
+
+
+def test_mcp_run_reads_stdin_that_is_not_a_pipe(tmp_path):
+    # /dev/null and regular files cannot be attached to the event loop; they are read on a thread
+    run_main = dict(
+        args=[sys.executable, "-c", "from mcp.server import main; main()"],
+        capture_output=True,
+        timeout=30,
+        cwd=Path(__file__).parent.parent,
+        env={**os.environ, "MEDGRAPH_SERVER": "http://localhost:9200"},
+    )
+
+    proc = subprocess.run(stdin=subprocess.DEVNULL, **run_main)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout == b""
+
+    requests_file = tmp_path / "requests.jsonl"
+    requests_file.write_text('{"jsonrpc": "2.0", "id": 1, "method": "tools/list"}\n{"jsonrpc": "2.0", "id": 2, "method": "no/such/method"}\n')
+    with open(requests_file, "rb") as stdin:
+        proc = subprocess.run(stdin=stdin, **run_main)
+    assert proc.returncode == 0, proc.stderr
+
+    responses = {r["id"]: r for r in map(json.loads, proc.stdout.splitlines())}
+    assert set(responses) == {1, 2}
+    assert len(responses[1]["tools"]) == 3
+    assert responses[2]["error"]["code"] == -32601
+
+
+def test_mcp_repeated_tool_call_is_served_from_cache(monkeypatch):
+    class CountingClient:
+        calls = 0
+
+        def execute_raw(self, query_dict):
+            CountingClient.calls += 1
+            return {"results": [{"pmc_id": "PMC111", "title": "Study A", "section": "results", "score": 0.9, "chunk_text": "Findings..."}]}
+
+    server = MCPServer(server_url="http://localhost:9200")
+    server.client = CountingClient()
+
+    first = asyncio.run(server.handle_call_tool("pubmed_graph_search", {"query": "BRCA1 breast cancer"}))
+    first["id"] = 1  # the transport adds fields to the response; the cached entry must not see them
+    second = asyncio.run(server.handle_call_tool("pubmed_graph_search", {"query": "BRCA1 breast cancer"}))
+
+    assert CountingClient.calls == 1
+    assert "id" not in second
+    assert second["content"] == first["content"]
+
+    # Arguments differing only in case or whitespace are different queries
+    other = asyncio.run(server.handle_call_tool("pubmed_graph_search", {"query": "brca1  breast cancer"}))
+    assert CountingClient.calls == 2
+    assert "brca1  breast cancer" in other["content"][0]["text"]
+
+    # Expired entries go back to the backend
+    monkeypatch.setattr("mcp.server.RESPONSE_CACHE_TTL", 0)
+    asyncio.run(server.handle_call_tool("pubmed_graph_search", {"query": "BRCA1 breast cancer", "max_depth": 3}))
+    asyncio.run(server.handle_call_tool("pubmed_graph_search", {"query": "BRCA1 breast cancer", "max_depth": 3}))
+    assert CountingClient.calls == 4
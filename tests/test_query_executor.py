@@ -0,0 +1,47 @@
+from tests.mini_server import query_executor
+
+
+def _chain_graph(num_chains):
+    # drug -targets-> protein -associated_with-> disease, repeated num_chains times
+    entities = {}
+    relationships = []
+    for i in range(num_chains):
+        entities[f"drug{i}"] = {"id": f"drug{i}", "type": "drug", "name": f"Drug {i}"}
+        entities[f"protein{i}"] = {"id": f"protein{i}", "type": "protein", "name": f"Protein {i}"}
+        entities[f"disease{i}"] = {"id": f"disease{i}", "type": "disease", "name": f"Disease {i}"}
+        relationships.append({"subject_id": f"drug{i}", "object_id": f"protein{i}", "predicate": "targets", "confidence": 0.9})
+        relationships.append({"subject_id": f"protein{i}", "object_id": f"disease{i}", "predicate": "associated_with", "confidence": 0.8})
+    return entities, relationships
+
+
+def test_path_query_compiles_each_edge_spec_once_per_hop(monkeypatch):
+    calls = []
+    compile_edge_spec = query_executor.compile_edge_spec
+
+    def counting_compile_edge_spec(edge_spec):
+        calls.append(edge_spec)
+        return compile_edge_spec(edge_spec)
+
+    monkeypatch.setattr(query_executor, "compile_edge_spec", counting_compile_edge_spec)
+
+    query = {
+        "find": "paths",
+        "path_pattern": {
+            "start": {"node_type": "drug"},
+            "edges": [
+                [{"relation_type": "targets"}, {"node_type": "protein"}],
+                [{"relation_type": "associated_with"}, {"node_type": "disease"}],
+            ],
+            "max_hops": 2,
+        },
+    }
+
+    for num_chains in (1, 25):
+        calls.clear()
+        entities, relationships = _chain_graph(num_chains)
+        result = query_executor.execute_path_query(query, entities, relationships)
+
+        assert len(result["results"]) == num_chains
+        # Once per hop for the backward pruning pass and once per hop for the
+        # traversal, however many start nodes and edges are visited
+        assert len(calls) == 2 * len(query["path_pattern"]["edges"])